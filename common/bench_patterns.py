@@ -0,0 +1,99 @@
+from datetime import datetime
+import argparse
+import timeit
+import re
+
+from common import patterns
+
+
+def get_args():
+    parser = argparse.ArgumentParser(description='Micro-benchmark of validation rules')
+    parser.add_argument('-n', '--number', metavar='<number>', type=int, default=20,
+                        help='Specifies how many times every rule is run over its sample. Default - 20')
+
+    return parser.parse_args()
+
+
+# inline versions the parsers used before common.patterns
+def old_name(value):
+    return bool(re.match(r"^([A-Za-z\s\.',-]*)$", value))
+
+
+def old_email(value):
+    return bool(re.match(r'^([a-z0-9_-]+\.)*[a-z0-9_-]+@[a-z0-9_-]+(\.[a-z0-9_-]+)*\.[a-z]{2,6}$', value))
+
+
+def old_ssn(value):
+    return bool(re.match(r'^(?:\d[-.]?){2}\d[-.]?(?:\d[-.]?){4}\d[-.]?\d$', value))
+
+
+def old_mobile(value):
+    return bool(re.match(r'^[1]?\d{10}$', re.sub(r'\(|\)|-|\.|\s', '', value)))
+
+
+def old_format_phone(value):
+    digits_only = re.sub(r'\D', '', value)
+
+    if len(digits_only) == 11:
+        return re.sub(r'(1)(\d{3})(\d{3})(\d{4})', r'\1-\2-\3-\4', digits_only)
+
+    return re.sub(r'(\d{3})(\d{3})(\d{4})', r'\1-\2-\3', digits_only)
+
+
+def old_year(value):
+    try:
+        date = datetime.strptime(str(value), "%Y").date()
+        return date <= datetime.now().date()
+    except ValueError:
+        return False
+
+
+def old_date(value):
+    try:
+        date = datetime.strptime(value, "%d %B %Y").date()
+        return date if date <= datetime.now().date() else None
+    except ValueError:
+        return None
+
+
+def new_date(value):
+    date = patterns.parse_date(value)
+    return date if date is not None and date <= patterns.TODAY else None
+
+
+SAMPLES = {
+    'name': (old_name, patterns.is_name,
+             ['Mark Crocker', "O'Neil-Smith Jr.", 'Rut Evelin Yno&Atilde;an', 'malskdmm2malsdm', '']),
+    'email': (old_email, patterns.is_email,
+              ['awesomeking2005@yahoo.com', 'aey-ice@hotmail.com', 'ributh@yahoo.co.id', 'bad@@mail.com',
+               'UPPER@MAIL.COM', 'no-at-sign.com', 'a@b.toolongtld']),
+    'email (long invalid)': (old_email, patterns.is_email,
+                             ['a.' * 40 + 'a@' + 'b.' * 40 + 'b1', 'a' * 200 + '@' + 'b-' * 100, '.'.join('x' * 150)]),
+    'ssn': (old_ssn, patterns.is_ssn, ['123-45-6789', '123.45.6789', '123456789', '123--45-6789', '12-345-678']),
+    'mobile': (old_mobile, patterns.is_mobile,
+               ['(555) 123-4567', '1.555.123.4567', '555-1234', '15551234567', '25551234567', '555\xa0123\xa04567']),
+    'format phone': (old_format_phone, patterns.format_phone,
+                     ['(555) 123-4567', '1.555.123.4567', '555-1234', '25551234567', '555123456712']),
+    'year': (old_year, patterns.is_past_year, ['1969', '1982', '3000', '0000', '19', 'abcd']),
+    'date': (old_date, new_date, ['12 March 1985', '1 january 2001', '31 February 1990', '12 Mar 1985', '1 May 3000']),
+}
+
+
+def main():
+    number = get_args().number
+
+    print(f'{"rule":<24}{"old, sec":>12}{"new, sec":>12}{"speedup":>10}')
+
+    for rule, (old, new, values) in SAMPLES.items():
+        values = values * (1000 // len(values))
+
+        assert [old(value) for value in values] == [new(value) for value in values], rule
+
+        old_time = timeit.timeit(lambda: [old(value) for value in values], number=number)
+        new_time = timeit.timeit(lambda: [new(value) for value in values], number=number)
+
+        print(f'{rule:<24}{old_time:>12.4f}{new_time:>12.4f}{old_time / new_time:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+import argparse
+import tempfile
+import zipfile
+import time
+import os
+import re
+
+import openpyxl
+import pandas as pd
+
+from excel_parser import xl_parser, xl_parser_v2
+from common import xlsx
+
+
+def get_args():
+    parser = argparse.ArgumentParser(description='Regression checks of the EXCEL readers')
+    parser.add_argument('-r', '--rows', metavar='<rows>', type=int, default=5000,
+                        help='Specifies the number of data rows in generated sheets. Default - 5000')
+
+    return parser.parse_args()
+
+
+def write_sheet(path, rows, extra_columns=0):
+    header = ['First Name', 'Last Name', 'SSN', 'Address', 'Company', 'Department', 'Position', 'Zip',
+              'Mobile number']
+    # regular workbook writes <dimension> like Excel does, write-only one leaves it out
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(header + [f'Extra {num}' for num in range(extra_columns)])
+
+    for num in range(rows):
+        sheet.append([f'First{num}', 'Last', '123-45-6789', f'{num} Main Street, Springfield, IL 62701',
+                      'Company', 'IT', 'engineer', 62701 + num, '(555) 123-4567']
+                     + [f'extra {num} {col}' for col in range(extra_columns)])
+
+    workbook.save(path)
+
+
+def set_dimension(path, ref):
+    # rewrite <dimension> of the first sheet, the way a buggy exporter leaves it
+    with zipfile.ZipFile(path) as archive:
+        files = {name: archive.read(name) for name in archive.namelist()}
+
+    sheet_name = 'xl/worksheets/sheet1.xml'
+    files[sheet_name] = re.sub(rb'<dimension ref="[^"]*"\s*/>', f'<dimension ref="{ref}"/>'.encode(),
+                               files[sheet_name])
+
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+
+
+def read_rows(path, selected_columns):
+    workbook = xlsx.open_workbook(path)
+
+    try:
+        return list(xl_parser_v2.get_raw_rows(workbook, selected_columns))
+    finally:
+        workbook.close()
+
+
+def read_openpyxl_rows(path, selected_columns):
+    # what xl_parser_v2 read before, every cell up to the last selected column is converted
+    workbook = openpyxl.load_workbook(path, read_only=True)
+
+    try:
+        return [{column: row[num] for num, column in selected_columns.items()}
+                for row in workbook.active.iter_rows(min_row=2, max_col=max(selected_columns) + 1,
+                                                     values_only=True)]
+    finally:
+        workbook.close()
+
+
+def read_excel(path, usecols):
+    # what xl_parser read before
+    return pd.read_excel(io=path, sheet_name=0, usecols=usecols)
+
+
+def timed(function, *args):
+    start = time.time()
+    result = function(*args)
+
+    return result, time.time() - start
+
+
+def compare_readers(path, name):
+    # the pruned readers have to return the same values as openpyxl and read_excel
+    rows, rows_time = timed(read_rows, path, xl_parser_v2.VALIDATED_COLUMNS)
+    old_rows, old_rows_time = timed(read_openpyxl_rows, path, xl_parser_v2.VALIDATED_COLUMNS)
+    assert rows == old_rows, f'{name}: xl_parser_v2 rows differ from openpyxl'
+
+    df, df_time = timed(xl_parser.read_sheet, path, xl_parser.VALIDATED_COLUMNS)
+    old_df, old_df_time = timed(read_excel, path, xl_parser.VALIDATED_COLUMNS)
+    pd.testing.assert_frame_equal(df, old_df)
+
+    print(f'{name:<24}{old_rows_time:>12.2f}{rows_time:>12.2f}{old_df_time:>12.2f}{df_time:>12.2f}')
+
+
+def main():
+    rows = get_args().rows
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f'{"sheet":<24}{"openpyxl":>12}{"v2 rows":>12}{"read_excel":>12}{"read_sheet":>12}')
+
+        for name, extra_columns in (('narrow, 9 columns', 0), ('wide, 129 columns', 120)):
+            path = os.path.join(directory, f'{extra_columns}.xlsx')
+            write_sheet(path, rows, extra_columns)
+            compare_readers(path, name)
+
+        # the rows are found without the <dimension> tag, a stale one must not drop them
+        path = os.path.join(directory, 'stale.xlsx')
+        write_sheet(path, rows)
+        set_dimension(path, 'A1:I3')
+        assert len(read_rows(path, xl_parser_v2.SELECTED_COLUMNS)) == rows, 'stale <dimension> drops rows'
+
+
+if __name__ == '__main__':
+    main()
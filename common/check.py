@@ -0,0 +1,52 @@
+import random
+
+
+def add_check_args(parser):
+    parser.add_argument('-c', '--check',
+                        action='store_true',
+                        help='run validation rules only and print a report, CSV files are not written')
+    parser.add_argument('-s', '--sample', metavar='<sample-size>', type=int, default=10,
+                        help='Specifies the size of bad rows sample for --check mode. Default - 10')
+
+
+def check_rows(rows, get_rule_results, sample_size):
+    # rows are (position, row) pairs, position locates the row in the source file
+    good, bad = 0, 0
+    failed_rules = dict()
+    sample = list()
+
+    for position, row in rows:
+        failed = [rule for rule, passed in get_rule_results(row).items() if not passed]
+
+        if not failed:
+            good += 1
+            continue
+
+        bad += 1
+
+        for rule in failed:
+            failed_rules[rule] = failed_rules.get(rule, 0) + 1
+
+        # reservoir sampling, every bad row gets into the sample with equal probability
+        if len(sample) < sample_size:
+            sample.append((position, row))
+        else:
+            index = random.randrange(bad)
+            if index < sample_size:
+                sample[index] = (position, row)
+
+    return good, bad, failed_rules, sample
+
+
+def print_report(good, bad, failed_rules, sample, position_name='row'):
+    print(f'Valid rows: {good}')
+    print(f'Invalid rows: {bad}')
+
+    for rule, count in sorted(failed_rules.items(), key=lambda item: item[1], reverse=True):
+        print(f'    {rule}: {count}')
+
+    if sample:
+        print(f'Sample of invalid rows ({len(sample)}):')
+
+        for position, row in sorted(sample, key=lambda item: item[0]):
+            print(f'    {position_name} {position}: {row}')
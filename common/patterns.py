@@ -0,0 +1,102 @@
+import calendar
+import datetime
+import re
+
+# all patterns are compiled once on import, the validation ones are matched with fullmatch without '^' and '$'
+NAME = re.compile(r"[A-Za-z\s.',-]*")
+# every label starts with a dot, so a failed match can't backtrack into the previous label
+EMAIL = re.compile(r'[a-z0-9_-]+(?:\.[a-z0-9_-]+)*@[a-z0-9_-]+(?:\.[a-z0-9_-]+)+')
+# same as ^(?:\d[-.]?){2}\d[-.]?(?:\d[-.]?){4}\d[-.]?\d$ - nine digits with optional single separators
+SSN = re.compile(r'(?:\d[-.]?){8}\d')
+MOBILE = re.compile(r'1?\d{10}')
+PHONE_SEPARATORS = re.compile(r'[().\s-]')
+NON_DIGIT = re.compile(r'\D')
+PHONE_10 = re.compile(r'(\d{3})(\d{3})(\d{4})')
+# ADDRESS keeps '^...$' and is used with .match: '$' also matches before a trailing newline, fullmatch would not
+ADDRESS = re.compile(r"^([A-Za-z.\s']*\d[A-Za-z.\d\s']*)?,?\s?([A-Z'\sa-z]*?)?,?\s?([A-Z]{2})?\s?([\d-]*)?$")
+# the same grammar as datetime.strptime(value, '%d %B %Y')
+DATE = re.compile(r'(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])\s+([a-z]+)\s+(\d{4})', re.IGNORECASE)
+
+# ascii whitespace in terms of \s and str.isspace, including \x1c-\x1f
+ASCII_WHITESPACE = ''.join(char for char in map(chr, range(128)) if char.isspace())
+PHONE_SEPARATORS_TABLE = dict.fromkeys(map(ord, '().-' + ASCII_WHITESPACE))
+MONTHS = {name.lower(): num for num, name in enumerate(calendar.month_name) if name}
+
+# taken once per run instead of datetime.now() per row
+TODAY = datetime.date.today()
+
+
+def is_name(value):
+    return NAME.fullmatch(value) is not None
+
+
+def is_email(value):
+    # exactly one '@' is required, cheap to check before the regex
+    if value.count('@') != 1 or EMAIL.fullmatch(value) is None:
+        return False
+
+    tld = value[value.rfind('.') + 1:]
+
+    return 2 <= len(tld) <= 6 and tld.isascii() and tld.isalpha() and tld.islower()
+
+
+def is_ssn(value):
+    return SSN.fullmatch(value) is not None
+
+
+def is_mobile(value):
+    # \s matches unicode whitespace too, so non-ascii values go through the regex
+    if not value.isascii():
+        return MOBILE.fullmatch(PHONE_SEPARATORS.sub('', value)) is not None
+
+    digits = value.translate(PHONE_SEPARATORS_TABLE)
+
+    return digits.isdigit() and (len(digits) == 10 or (len(digits) == 11 and digits[0] == '1'))
+
+
+def format_phone(number):
+    digits = NON_DIGIT.sub('', number)
+
+    if len(digits) == 11:
+        if digits[0] == '1':
+            return f'{digits[0]}-{digits[1:4]}-{digits[4:7]}-{digits[7:]}'
+        return digits
+
+    if len(digits) == 10:
+        return f'{digits[:3]}-{digits[3:6]}-{digits[6:]}'
+
+    return PHONE_10.sub(r'\1-\2-\3', digits)
+
+
+def parse_year(value):
+    value = str(value)
+
+    if len(value) != 4 or not value.isdecimal():
+        return None
+
+    year = int(value)
+
+    return year if year >= datetime.MINYEAR else None
+
+
+def is_past_year(value):
+    year = parse_year(value)
+
+    return year is not None and year <= TODAY.year
+
+
+def parse_date(value):
+    match = DATE.fullmatch(value)
+
+    if match is None:
+        return None
+
+    month = MONTHS.get(match.group(2).lower())
+
+    if month is None:
+        return None
+
+    try:
+        return datetime.date(int(match.group(3)), month, int(match.group(1)))
+    except ValueError:
+        return None
@@ -0,0 +1,140 @@
+from openpyxl.worksheet._reader import WorkSheetParser, VALUE_TAG
+from openpyxl.xml.constants import SHARED_STRINGS, SHEET_MAIN_NS
+from openpyxl.utils.cell import column_index_from_string
+from openpyxl.styles.stylesheet import apply_stylesheet
+from openpyxl.reader.excel import ExcelReader
+from openpyxl.xml.functions import fromstring
+from openpyxl.cell.text import Text
+
+# relies on openpyxl internals (ExcelReader steps, WorkSheetParser), openpyxl is pinned in requirements
+
+STRING_TAG = '{%s}si' % SHEET_MAIN_NS
+TEXT_TAG = '{%s}t' % SHEET_MAIN_NS
+
+
+class SharedStrings(object):
+    """Shared strings table which converts a string only when a cell refers to it."""
+
+    def __init__(self, xml):
+        # the tree is built by the C parser, Python-level work is left for the strings in use
+        self.nodes = fromstring(xml).findall(STRING_TAG)
+        self.strings = dict()
+
+    def __getitem__(self, index):
+        if index not in self.strings:
+            node = self.nodes[index]
+
+            # plain string is a single <t>, rich text with runs goes through openpyxl
+            if len(node) == 1 and node[0].tag == TEXT_TAG:
+                value = node[0].text or ''
+            else:
+                value = Text.from_tree(node).content
+
+            self.strings[index] = value.replace('x005F_', '')
+
+        return self.strings[index]
+
+
+class WorkbookReader(ExcelReader):
+    """
+    ExcelReader which reads only what cell values need: shared strings, sheet list and styles.
+
+    Read-only openpyxl workbook parses on load every sheet without the <dimension> tag to get its size,
+    here a sheet is parsed only by iter_rows.
+    """
+
+    def __init__(self, fn, data_only=False):
+        super().__init__(fn, read_only=True, data_only=data_only, keep_links=False)
+        self.sheet_paths = list()
+
+    def read(self):
+        self.read_manifest()
+        self.read_strings()
+        self.read_workbook()
+        apply_stylesheet(self.archive, self.wb)
+        self.sheet_paths = [rel.target for _, rel in self.parser.find_sheets()]
+
+    def read_strings(self):
+        content_type = self.package.find(SHARED_STRINGS)
+
+        if content_type is not None:
+            with self.archive.open(content_type.PartName[1:]) as src:
+                self.shared_strings = SharedStrings(src.read())
+
+    @property
+    def active_sheet(self):
+        return self.sheet_paths[self.wb._active_sheet_index]
+
+    def close(self):
+        self.archive.close()
+
+
+def open_workbook(source, data_only=False):
+    workbook = WorkbookReader(source, data_only)
+    workbook.read()
+
+    return workbook
+
+
+class ColumnsParser(WorkSheetParser):
+    """WorkSheetParser which converts only the cells of the selected columns."""
+
+    def __init__(self, src, shared_strings, columns=None, **kwargs):
+        super().__init__(src, shared_strings, **kwargs)
+        self.columns = columns
+        self.row_has_cells = False
+        self.row_has_other_values = False
+
+    def parse_row(self, row):
+        row_number = row.get('r')
+        self.row_counter = int(row_number) if row_number else self.row_counter + 1
+        self.col_counter = 0
+        self.row_has_cells = len(row) > 0
+        self.row_has_other_values = False
+
+        cells = list()
+
+        for element in row:
+            coordinate = element.get('r')
+            column = column_index_from_string(coordinate.rstrip('0123456789')) if coordinate \
+                else self.col_counter + 1
+
+            # skipped cells are never converted, no shared string lookup, number or date casting
+            if self.columns is None or column in self.columns:
+                cells.append(self.parse_cell(element))
+            else:
+                self.col_counter = column
+
+                if not self.row_has_other_values:
+                    self.row_has_other_values = bool(element.findtext(VALUE_TAG)) or element.get('t') == 'inlineStr'
+
+        return self.row_counter, cells
+
+
+def iter_rows(workbook, sheet_path, columns=None, min_row=1):
+    """
+    Yield (row number, {column: value}, has other values) for the rows of a sheet starting with min_row.
+
+    Only the cells of columns (1-based numbers, None - all columns) are converted, for the rest of
+    the row it is only known whether any of them has a value. Rows missing in the source are yielded
+    empty, the <dimension> tag of the sheet is not used.
+    """
+    next_row = min_row
+
+    with workbook.archive.open(sheet_path) as src:
+        parser = ColumnsParser(src, workbook.shared_strings, columns,
+                               data_only=workbook.data_only,
+                               epoch=workbook.wb.epoch,
+                               date_formats=workbook.wb._date_formats,
+                               timedelta_formats=workbook.wb._timedelta_formats)
+
+        for row_number, cells in parser.parse():
+            # rows without cells are yielded only as gaps before the next row with cells, like openpyxl does
+            if row_number < min_row or not parser.row_has_cells:
+                continue
+
+            for missing_row in range(next_row, row_number):
+                yield missing_row, dict(), False
+
+            yield row_number, {cell['column']: cell['value'] for cell in cells}, parser.row_has_other_values
+            next_row = row_number + 1
@@ -1,9 +1,17 @@
+from pandas.io.parsers import TextParser
+from openpyxl.cell.cell import ERROR_CODES
 import pandas as pd
+import numpy as np
 import argparse
 import time
-import re
 import os
 
+from common import patterns, check, xlsx
+
+REQUIRED_COLUMNS = ['First Name', 'Last Name', 'SSN', 'Address', 'Company', 'Department', 'Position', 'Zip',
+                    'Mobile number']
+VALIDATED_COLUMNS = ['SSN', 'First Name', 'Last Name', 'Mobile number']
+
 
 def get_args():
     parser = argparse.ArgumentParser(description='EXCEL to CSV parser')
@@ -18,9 +26,62 @@ def get_args():
                        action='store_true',
                        help='use option to get feedback about completing')
 
+    check.add_check_args(parser)
+
     return parser.parse_args()
 
 
+def convert_cell(value):
+    # the same conversion as pandas read_excel does for openpyxl cells
+    if value is None:
+        return ''
+
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+
+    if isinstance(value, str) and value in ERROR_CODES:
+        return np.nan
+
+    return value
+
+
+def read_sheet(source, usecols):
+    workbook = xlsx.open_workbook(source, data_only=True)
+
+    try:
+        sheet = workbook.sheet_paths[0]
+        header_row, header, _ = next(xlsx.iter_rows(workbook, sheet), (1, dict(), False))
+
+        columns = dict()
+
+        for column, name in sorted(header.items()):
+            if name in usecols and name not in columns.values():
+                columns[column] = name
+
+        missing = [name for name in usecols if name not in columns.values()]
+
+        if missing:
+            raise ValueError(f'Usecols do not match columns, columns expected but not found: {missing}')
+
+        data = [list(columns.values())]
+        last_row_with_data = 0
+
+        # only the used columns are converted, the rest of every row is skipped by the reader
+        for _, values, has_other_values in xlsx.iter_rows(workbook, sheet, set(columns), min_row=header_row + 1):
+            data.append([convert_cell(values.get(column)) for column in columns])
+
+            if has_other_values or any(value != '' for value in data[-1]):
+                last_row_with_data = len(data) - 1
+
+    finally:
+        workbook.close()
+
+    # trailing empty rows are dropped like read_excel does
+    data = data[:last_row_with_data + 1]
+
+    return TextParser(data, header=0, skip_blank_lines=False).read()
+
+
 def df_to_csv(df, destination, selected_columns):
     clear_df = df[df['valid'].astype(bool) == True]
     bad_df = df[df['valid'].astype(bool) == False]
@@ -41,36 +102,27 @@ def compile_additional_info(row):
 
 
 def normalize_mobile_number(row):
-    digits_only = re.sub(r'\D', '', row)
-
-    if len(digits_only) == 11:
-        formatted_number = re.sub(r'(1)(\d{3})(\d{3})(\d{4})', r'\1-\2-\3-\4', digits_only)
-    else:
-        formatted_number = re.sub(r'(\d{3})(\d{3})(\d{4})', r'\1-\2-\3', digits_only)
-
-    return formatted_number
+    return patterns.format_phone(row)
 
 
-def validation_process(row):
-    pattern_ssn = r'^(?:\d[-.]?){2}\d[-.]?(?:\d[-.]?){4}\d[-.]?\d$'
+def get_rule_results(row):
     # pattern_name = r"^(?!.*[A-Z]{3})(?!.*[A-Z].*[A-Z].*[A-Z])(?:[A-Z][a-z']* ?)+$"
-    pattern_name = r"^([A-Za-z\s\.',-]*)$"
-    pattern_mobile = r'^[1]?\d{10}$'
+    ssn = patterns.is_ssn(row['SSN']) if row['SSN'] else True
+    first_name = patterns.is_name(row['First Name']) if row['First Name'] else True
+    last_name = patterns.is_name(row['Last Name']) if row['Last Name'] else True
+    mobile = patterns.is_mobile(row['Mobile number']) if row['Mobile number'] else True
+
+    return {'ssn': ssn, 'first_name': first_name, 'last_name': last_name, 'mobile': mobile}
 
-    ssn = bool(re.match(pattern_ssn, row['SSN'])) if row['SSN'] else True
-    first_name = bool(re.match(pattern_name, row['First Name'])) if row['First Name'] else True
-    last_name = bool(re.match(pattern_name, row['Last Name'])) if row['Last Name'] else True
-    mobile = bool(re.match(pattern_mobile, re.sub(r'\(|\)|-|\.|\s', '', row['Mobile number']))) \
-        if row['Mobile number'] else True
 
-    return all([ssn, first_name, last_name, mobile])
+def validation_process(row):
+    return all(get_rule_results(row).values())
 
 
 def split_address(row):
     # variant 2
-    if re.search(r',+', row):
-        split_pattern = r"^([A-Za-z.\s']*\d[A-Za-z.\d\s']*)?,?\s?([A-Z'\sa-z]*?)?,?\s?([A-Z]{2})?\s?([\d-]*)?$"
-        match = re.search(split_pattern, row)
+    if ',' in row:
+        match = patterns.ADDRESS.match(row)
 
         if match:
             address = match.group(1) if match.group(1) else None
@@ -130,8 +182,19 @@ def processing(df, source, destination):
     df_to_csv(ready_df, destination, selected_columns)
 
 
+def check_process(df, sample_size):
+    # header is the first sheet row and read_excel keeps blank rows, so index + 2 is the sheet row
+    records = df[VALIDATED_COLUMNS].astype(object)
+    # blank cells come as NaN, which is truthy and would reach the rules instead of being skipped
+    records = records.where(records.notna(), None)
+    rows = zip(df.index + 2, records.to_dict('records'))
+
+    check.print_report(*check.check_rows(rows, get_rule_results, sample_size), 'sheet row')
+
+
 def main():
-    source, destination, debug = get_args().source, get_args().destination, get_args().debug
+    args = get_args()
+    source, destination, debug = args.source, args.destination, args.debug
     start = time.time()
 
     if not source:
@@ -150,11 +213,14 @@ def main():
         try:
             print(source)
             print(destination)
-            sheet_name = pd.ExcelFile(source).sheet_names[0]
-            df = pd.read_excel(io=source, sheet_name=sheet_name)
-            processing(df, source, destination)
+            df = read_sheet(source, VALIDATED_COLUMNS if args.check else REQUIRED_COLUMNS)
+
+            if args.check:
+                check_process(df, args.sample)
+            else:
+                processing(df, source, destination)
 
-            print(f'CSV is ready. Path: {destination + ".csv"}')
+                print(f'CSV is ready. Path: {destination + ".csv"}')
 
             if debug:
                 print(f'Time spent to execution: {time.time() - start} sec.')
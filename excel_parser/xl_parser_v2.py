@@ -1,10 +1,24 @@
 import argparse
-import openpyxl
 import time
 import csv
-import re
 import os
 
+from common import patterns, check, xlsx
+
+SELECTED_COLUMNS = {0: 'first_name',
+                    1: 'last_name',
+                    2: 'ssn',
+                    3: 'address',
+                    4: 'company',
+                    5: 'department',
+                    6: 'position',
+                    7: 'zip',
+                    8: 'mobile_number'}
+VALIDATED_COLUMNS = {0: 'first_name',
+                     1: 'last_name',
+                     2: 'ssn',
+                     8: 'mobile_number'}
+
 
 def get_args():
     parser = argparse.ArgumentParser(description='EXCEL to CSV parser')
@@ -19,6 +33,8 @@ def get_args():
                        action='store_true',
                        help='use option to get feedback about completing')
 
+    check.add_check_args(parser)
+
     return parser.parse_args()
 
 
@@ -37,9 +53,8 @@ def get_clear_row(row, sep, source):
 
     def get_normalized_address(address_row):
         # variant 2
-        if re.search(r',+', address_row):
-            split_pattern = r"^([A-Za-z.\s']*\d[A-Za-z.\d\s']*)?,?\s?([A-Z'\sa-z]*?)?,?\s?([A-Z]{2})?\s?([\d-]*)?$"
-            match = re.search(split_pattern, address_row)
+        if ',' in address_row:
+            match = patterns.ADDRESS.match(address_row)
 
             if match:
                 address = match.group(1) if match.group(1) else None
@@ -70,16 +85,6 @@ def get_clear_row(row, sep, source):
         #     else:
         #         return address_row, None, None
 
-    def get_normalized_mobile_number(number):
-        digits_only = re.sub(r'\D', '', number)
-
-        if len(digits_only) == 11:
-            formatted_number = re.sub(r'(1)(\d{3})(\d{3})(\d{4})', r'\1-\2-\3-\4', digits_only)
-        else:
-            formatted_number = re.sub(r'(\d{3})(\d{3})(\d{4})', r'\1-\2-\3', digits_only)
-
-        return formatted_number
-
     def compile_additional_info(additional_row):
         additional_info = list()
         additional_info.append(f"ssn:{additional_row['ssn']}" if additional_row['ssn'] else None)
@@ -95,38 +100,36 @@ def get_clear_row(row, sep, source):
     clear_row[1], clear_row[3], clear_row[4] = get_normalized_address(row['address'])
     clear_row[2] = ' '.join([row['first_name'], row['last_name']])
     clear_row[5] = row['zip']
-    clear_row[6] = get_normalized_mobile_number(row['mobile_number'])
+    clear_row[6] = patterns.format_phone(row['mobile_number'])
     clear_row[7] = compile_additional_info(row)
 
     return clear_row
 
 
-def get_validated_row(row):
-    pattern_ssn = r'^(?:\d[-.]?){2}\d[-.]?(?:\d[-.]?){4}\d[-.]?\d$'
+def get_rule_results(row):
     # pattern_name = r"^(?!.*[A-Z]{3})(?!.*[A-Z].*[A-Z].*[A-Z])(?:[A-Z][a-z']* ?)+$"
-    pattern_name = r"^([A-Za-z\s\.',-]*)$"
-    pattern_mobile = r'^[1]?\d{10}$'
+    ssn = patterns.is_ssn(row['ssn']) if row['ssn'] else True
+    first_name = patterns.is_name(row['first_name']) if row['first_name'] else True
+    last_name = patterns.is_name(row['last_name']) if row['last_name'] else True
+    mobile = patterns.is_mobile(row['mobile_number']) if row['mobile_number'] else True
 
-    ssn = bool(re.match(pattern_ssn, row['ssn'])) if row['ssn'] else True
-    first_name = bool(re.match(pattern_name, row['first_name'])) if row['first_name'] else True
-    last_name = bool(re.match(pattern_name, row['last_name'])) if row['last_name'] else True
-    mobile = bool(re.match(pattern_mobile, re.sub(r'\(|\)|-|\.|\s', '', row['mobile_number'])))\
-        if row['mobile_number'] else True
+    return {'ssn': ssn, 'first_name': first_name, 'last_name': last_name, 'mobile': mobile}
 
-    return all([ssn, first_name, last_name, mobile])
+
+def get_validated_row(row):
+    return all(get_rule_results(row).values())
 
 
-def process_sheet(sheet, source, destination):
-    selected_columns = {0: 'first_name',
-                        1: 'last_name',
-                        2: 'ssn',
-                        3: 'address',
-                        4: 'company',
-                        5: 'department',
-                        6: 'position',
-                        7: 'zip',
-                        8: 'mobile_number'}
+def get_raw_rows(workbook, selected_columns):
+    # cells of other columns are skipped before conversion, the <dimension> tag of the sheet is not used
+    columns = {num + 1 for num in selected_columns}
+
+    for _, values, _ in xlsx.iter_rows(workbook, workbook.active_sheet, columns, min_row=2):
+        # dict with elements of row
+        yield {column: values.get(num + 1) for num, column in selected_columns.items()}
 
+
+def process_sheet(workbook, source, destination):
     result_header = ['name',
                      'address',
                      'user_fullname',
@@ -141,16 +144,15 @@ def process_sheet(sheet, source, destination):
     write_row(result_header, False, destination, 'w')
     write_row(result_header, True, destination, 'w')
 
-    for row in sheet.iter_rows(min_row=2):
-        # dict with elements of row
-        raw_row = {selected_columns[num]: cell.value for num, cell in enumerate(row) if num in selected_columns}
+    for raw_row in get_raw_rows(workbook, SELECTED_COLUMNS):
         valid = get_validated_row(raw_row)
         clear_row = get_clear_row(raw_row, sep, source)
         write_row(clear_row, valid, destination)
 
 
 def main():
-    source, destination, debug = get_args().source, get_args().destination, get_args().debug
+    args = get_args()
+    source, destination, debug = args.source, args.destination, args.debug
     start = time.time()
 
     if not source:
@@ -167,10 +169,19 @@ def main():
 
     if destination and source:
         try:
-            sheet = openpyxl.load_workbook(source).active
-            process_sheet(sheet, source, destination)
-
-            print(f'CSV is ready. Path: {destination + ".csv"}')
+            workbook = xlsx.open_workbook(source)
+
+            try:
+                if args.check:
+                    rows = enumerate(get_raw_rows(workbook, VALIDATED_COLUMNS), start=2)
+                    check.print_report(*check.check_rows(rows, get_rule_results, args.sample), 'sheet row')
+                else:
+                    process_sheet(workbook, source, destination)
+
+                    print(f'CSV is ready. Path: {destination + ".csv"}')
+            finally:
+                # workbook reads sheets lazily and keeps the file handle open until closed
+                workbook.close()
 
             if debug:
                 print(f'Time spent to execution: {time.time() - start} sec.')
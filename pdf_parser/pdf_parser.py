@@ -1,13 +1,16 @@
 # import pdfplumber
-from datetime import datetime
 from tabula import read_pdf
 import pandas as pd
 import numpy as np
 import argparse
 import time
-import re
 import os
 
+from common import patterns, check
+
+REQUIRED_FIELDS = ['name', 'email', 'address', 'tel', 'date', 'nationality']
+VALIDATED_FIELDS = ['name', 'tel', 'email', 'date']
+
 
 def get_args():
     parser = argparse.ArgumentParser(description='EXCEL to CSV parser')
@@ -22,6 +25,8 @@ def get_args():
                        action='store_true',
                        help='use option to get feedback about completing')
 
+    check.add_check_args(parser)
+
     return parser.parse_args()
 
 
@@ -34,9 +39,8 @@ def df_to_csv(df, destination, selected_columns):
 
 
 def split_address(row):
-    if re.search(r',+', row):
-        split_pattern = r"^([A-Za-z.\s']*\d[A-Za-z.\d\s']*)?,?\s?([A-Z'\sa-z]*?)?,?\s?([A-Z]{2})?\s?([\d-]*)?$"
-        match = re.search(split_pattern, row)
+    if ',' in row:
+        match = patterns.ADDRESS.match(row)
 
         if match:
             address = match.group(1) if match.group(1) else None
@@ -49,38 +53,29 @@ def split_address(row):
 
 
 def normalize_mobile_number(row):
-    digits_only = re.sub(r'\D', '', row)
-
-    if len(digits_only) == 11:
-        formatted_number = re.sub(r'(1)(\d{3})(\d{3})(\d{4})', r'\1-\2-\3-\4', digits_only)
-    else:
-        formatted_number = re.sub(r'(\d{3})(\d{3})(\d{4})', r'\1-\2-\3', digits_only)
-
-    return formatted_number
+    return patterns.format_phone(row)
 
 
 def normalize_date(row):
-    try:
-        date = datetime.strptime(row, "%d %B %Y").date()
-        if date > datetime.now().date():
-            date = row
-    except ValueError:
+    date = patterns.parse_date(row)
+
+    if date is None or date > patterns.TODAY:
         date = row
 
     return date
 
 
-def validation_process(row):
-    pattern_name = r"^([A-Za-z\s\.',-]*)$"
-    pattern_tel = r'^[1]?\d{10}$'
-    pattern_email = r'^([a-z0-9_-]+\.)*[a-z0-9_-]+@[a-z0-9_-]+(\.[a-z0-9_-]+)*\.[a-z]{2,6}$'
-
-    name = bool(re.match(pattern_name, row['name'])) if row['name'] else True
-    tel = bool(re.match(pattern_tel, re.sub(r'\(|\)|-|\.|\s', '', row['tel']))) if row['tel'] else True
-    email = bool(re.match(pattern_email, row['email'])) if row['email'] else True
+def get_rule_results(row):
+    name = patterns.is_name(row['name']) if row['name'] else True
+    tel = patterns.is_mobile(row['tel']) if row['tel'] else True
+    email = patterns.is_email(row['email']) if row['email'] else True
     dob = bool(row['date'] != normalize_date(row['date'])) if row['date'] else True
 
-    return all([name, tel, email, dob])
+    return {'name': name, 'tel': tel, 'email': email, 'dob': dob}
+
+
+def validation_process(row):
+    return all(get_rule_results(row).values())
 
 
 def compile_additional_info(row):
@@ -122,8 +117,19 @@ def processing(df, source, destination):
     df_to_csv(ready_df, destination, selected_columns)
 
 
+def check_process(df, sample_size):
+    # every record is a group of fields in the pdf, index + 1 is its number in the document
+    records = df[VALIDATED_FIELDS].astype(object)
+    # blank fields come as NaN, which is truthy and would reach the rules instead of being skipped
+    records = records.where(records.notna(), None)
+    rows = zip(df.index + 1, records.to_dict('records'))
+
+    check.print_report(*check.check_rows(rows, get_rule_results, sample_size), 'record')
+
+
 def main():
-    source, destination, debug = get_args().source, get_args().destination, get_args().debug
+    args = get_args()
+    source, destination, debug = args.source, args.destination, args.debug
     start = time.time()
 
     if not source:
@@ -151,15 +157,21 @@ def main():
             data_2d = np.squeeze(df_tabula)
             df = pd.DataFrame(data_2d, columns=['field', 'data'])
 
+            # fields which are not used by the current mode are dropped before transposing
+            df = df[df['field'].isin(VALIDATED_FIELDS if args.check else REQUIRED_FIELDS)]
+
             grouped_dates = df.groupby('field')['data']
             transposed_df = pd.DataFrame()
 
             for field, data in grouped_dates:
                 transposed_df[str(field)] = pd.Series(data.values)
 
-            processing(transposed_df, source, destination)
+            if args.check:
+                check_process(transposed_df, args.sample)
+            else:
+                processing(transposed_df, source, destination)
 
-            print(f'CSV is ready. Path: {destination + ".csv"}')
+                print(f'CSV is ready. Path: {destination + ".csv"}')
 
             if debug:
                 print(f'Time spent to execution: {time.time() - start} sec.')
@@ -1,4 +1,3 @@
-from datetime import datetime
 from io import StringIO
 import argparse
 import csv
@@ -6,6 +5,25 @@ import time
 import re
 import os
 
+from common import patterns, check
+
+SELECTED_COLUMNS = {0: 'user_ID',
+                    1: 'name',
+                    2: 'username',
+                    3: 'password',
+                    4: 'usermail',
+                    6: 'sex',
+                    7: 'country',
+                    8: 'birth'}
+VALIDATED_COLUMNS = {0: 'user_ID',
+                     1: 'name',
+                     4: 'usermail',
+                     8: 'birth'}
+
+INSERT_LINE = re.compile(r'^INSERT.*VALUES')
+LINE_WRAPPER = re.compile(r'^\(|\),$|\);$|\t')
+CELL_QUOTES = re.compile(r"^'|'$|\t")
+
 
 def get_args():
     parser = argparse.ArgumentParser(description='EXCEL to CSV parser')
@@ -20,6 +38,8 @@ def get_args():
                        action='store_true',
                        help='use option to get feedback about completing')
 
+    check.add_check_args(parser)
+
     return parser.parse_args()
 
 
@@ -41,18 +61,6 @@ def write_row(row, valid, destination, mode='a'):
 
 def get_clear_row(row, sep, source):
 
-    def normalize_date(row):
-        try:
-            if row is not None:
-                date = datetime.strptime(str(row), "%Y").date().year
-            else:
-                date = row
-
-        except ValueError:
-            date = None
-
-        return date
-
     def compile_additional_info(additional_row):
         additional_info = list()
         additional_info.append(f"password:{additional_row['password']}" if additional_row['password'] else None)
@@ -68,50 +76,67 @@ def get_clear_row(row, sep, source):
     clear_row[3] = row['usermail']
     clear_row[4] = row['name']
     clear_row[5] = row['country']
-    clear_row[6] = normalize_date(row['birth'])
+    clear_row[6] = patterns.parse_year(row['birth'])
     clear_row[7] = compile_additional_info(row)
 
     return clear_row
 
 
+def get_rule_results(row):
+    # тщетно пытался в последний момент отловить HTML сущности
+    # pattern_name = r"|^([A-Za-z\s\.',-]*(&[a-zA-Z]*;)*[A-Za-z\s\.',-]*)$"
+    name = patterns.is_name(row['name']) if row['name'] else True
+    usermail = patterns.is_email(row['usermail']) if row['usermail'] else True
+    birth = patterns.is_past_year(row['birth']) if row['birth'] else True
+
+    return {'name': name, 'usermail': usermail, 'birth': birth}
+
+
 def get_validated_row(row):
+    return all(get_rule_results(row).values())
 
-    def check_date(yob):
-        try:
-            if yob is not None:
-                date = datetime.strptime(str(yob), "%Y").date()
-                if date > datetime.now().date():
-                    date = None
-            else:
-                date = yob
 
-        except ValueError:
-            date = None
+def clear_cell(cell):
+    cell = CELL_QUOTES.sub('', cell.strip())
 
-        return date
+    return None if cell in ('', '0', 'NULL') else cell
 
-    pattern_name = r"^([A-Za-z\s\.',-]*)$"
-    # тщетно пытался в последний момент отловить HTML сущности
-    # pattern_name = r"|^([A-Za-z\s\.',-]*(&[a-zA-Z]*;)*[A-Za-z\s\.',-]*)$"
-    pattern_email = r'^([a-z0-9_-]+\.)*[a-z0-9_-]+@[a-z0-9_-]+(\.[a-z0-9_-]+)*\.[a-z]{2,6}$'
 
-    name = bool(re.match(pattern_name, row['name'])) if row['name'] else True
-    usermail = bool(re.match(pattern_email, row['usermail'])) if row['usermail'] else True
-    birth = bool(int(row['birth']) != check_date(row['birth'])) if row['birth'] else True
+def get_raw_rows(source, selected_columns):
+    with open(source, 'r', encoding='ANSI') as file:
+        for line_number, row in enumerate(file, start=1):
+            if INSERT_LINE.match(row):
+                continue
 
-    return all([name, usermail, birth])
+            line = LINE_WRAPPER.sub('', row).strip()
 
+            csv_row = list(*csv.reader(StringIO(line), delimiter=',', quotechar="'", skipinitialspace=True))
 
-def processing(source, destination):
-    selected_columns = {0: 'user_ID',
-                        1: 'name',
-                        2: 'username',
-                        3: 'password',
-                        4: 'usermail',
-                        6: 'sex',
-                        7: 'country',
-                        8: 'birth'}
+            # only selected cells are cleaned, the rest of the row is dropped as is
+            if len(csv_row) == 9:
+                yield line_number, {column: clear_cell(csv_row[num]) for num, column in selected_columns.items()}
+                continue
 
+            csv_row = [clear_cell(i) for i in csv_row]
+
+            # каличный отлов приколов с quotechar
+            temp_row = list()
+
+            for num, cell in enumerate(csv_row):
+                if cell is not None and ',' in cell:
+                    for i in cell.split(','):
+                        temp_row.append(i)
+                    continue
+                temp_row.append(cell)
+
+            csv_row = temp_row
+
+            raw_row = {selected_columns[num]: cell for num, cell in enumerate(csv_row) if num in selected_columns}
+
+            yield line_number, raw_row
+
+
+def processing(source, destination):
     result_header = ['name',
                      'username',
                      'user_ID',
@@ -126,38 +151,15 @@ def processing(source, destination):
     write_row(result_header, False, destination, 'w')
     write_row(result_header, True, destination, 'w')
 
-    with open(source, 'r', encoding='ANSI') as file:
-        for row in file:
-            if re.search(r'^INSERT.*VALUES', row):
-                continue
-
-            line = re.sub(r'^\(|\),$|\);$|\t', '', row).strip()
-
-            csv_row = list(*csv.reader(StringIO(line), delimiter=',', quotechar="'", skipinitialspace=True))
-
-            csv_row = [[j, None][j in ('', '0', 'NULL')] for j in [re.sub(r"^'|'$|\t", '', i.strip()) for i in csv_row]]
-
-            # каличный отлов приколов с quotechar
-            if len(csv_row) != 9:
-                temp_row = list()
-
-                for num, cell in enumerate(csv_row):
-                    if cell is not None and ',' in cell:
-                        for i in cell.split(','):
-                            temp_row.append(i)
-                        continue
-                    temp_row.append(cell)
-
-                csv_row = temp_row
-
-            raw_row = {selected_columns[num]: cell for num, cell in enumerate(csv_row) if num in selected_columns}
-            valid = get_validated_row(raw_row)
-            clear_row = get_clear_row(raw_row, sep, source)
-            write_row(clear_row, valid, destination)
+    for _, raw_row in get_raw_rows(source, SELECTED_COLUMNS):
+        valid = get_validated_row(raw_row)
+        clear_row = get_clear_row(raw_row, sep, source)
+        write_row(clear_row, valid, destination)
 
 
 def main():
-    source, destination, debug = get_args().source, get_args().destination, get_args().debug
+    args = get_args()
+    source, destination, debug = args.source, args.destination, args.debug
     start = time.time()
 
     if not source:
@@ -174,9 +176,13 @@ def main():
 
     if destination and source:
         try:
-            processing(source, destination)
+            if args.check:
+                rows = get_raw_rows(source, VALIDATED_COLUMNS)
+                check.print_report(*check.check_rows(rows, get_rule_results, args.sample), 'line')
+            else:
+                processing(source, destination)
 
-            print(f'CSV is ready. Path: {destination + ".csv"}')
+                print(f'CSV is ready. Path: {destination + ".csv"}')
 
             if debug:
                 print(f'Time spent to execution: {time.time() - start} sec.')